@@ -22,30 +22,21 @@ Tool Table YAML configuration:
 """
 
 import os
-import sys
-import re
-import io
 
-from itertools import takewhile
-from datetime import datetime
-
-from deepdiff import DeepDiff
+from types import MappingProxyType
 
 from  linuxcnc import command
 
-from qtpy.QtCore import QFileSystemWatcher, QTimer, Signal, Slot
-
-import qtpyvcp
+from qtpy.QtCore import QTimer, Signal
 
 from qtpyvcp.lib.db_tool.base import Session, Base, engine
-from qtpyvcp.lib.db_tool.tool_table import ToolTable, Tool
+from qtpyvcp.lib.db_tool.tool_table import Tool
 
 from qtpyvcp.utilities.info import Info
 from qtpyvcp.utilities.logger import getLogger
 from qtpyvcp.actions.machine_actions import issue_mdi
 from qtpyvcp.plugins import DataPlugin, DataChannel, getPlugin
-
-import pprint
+from qtpyvcp.plugins.tool_table import _validateColumns
 
 CMD = command()
 LOG = getLogger(__name__)
@@ -120,6 +111,48 @@ FLOAT_COLUMN_WIDTH = 12
 FLOAT_DECIMAL_PLACES = 6
 
 
+def toolRowToDict(tool):
+    """Convert a DB tool row to a tool data dict"""
+    return {'A': tool.a_offset,
+            'B': tool.b_offset,
+            'C': tool.c_offset,
+            'D': tool.diameter,
+            'I': 0.0,
+            'J': 0.0,
+            'P': tool.pocket,
+            'Q': 1,
+            'R': tool.remark,
+            'T': tool.tool_no,
+            'U': tool.u_offset,
+            'V': tool.v_offset,
+            'W': tool.w_offset,
+            'X': tool.x_offset,
+            'Y': tool.y_offset,
+            'Z': tool.z_offset}
+
+
+def toolDictToRow(tool_data):
+    """Convert a tool data dict to DB tool row column values"""
+    return {'remark': tool_data['R'],
+            'tool_no': tool_data['T'],
+            'in_use': False,
+            'pocket': tool_data['P'],
+            'x_offset': tool_data['X'],
+            'y_offset': tool_data['Y'],
+            'z_offset': tool_data['Z'],
+            'a_offset': tool_data['A'],
+            'b_offset': tool_data['B'],
+            'c_offset': tool_data['C'],
+            'i_offset': tool_data['I'],
+            'j_offset': tool_data['J'],
+            'q_offset': tool_data['Q'],
+            'u_offset': tool_data['U'],
+            'v_offset': tool_data['V'],
+            'w_offset': tool_data['W'],
+            'diameter': tool_data['D'],
+            'tool_table_id': 1}
+
+
 def makeLorumIpsumToolTable():
     return {i: merge(DEFAULT_TOOL,
                      {'T': i, 'P': i, 'R': 'Lorum Ipsum ' + str(i)})
@@ -234,8 +267,10 @@ class DBToolTable(DataPlugin):
         if not isinstance(columns, (str, list, tuple)):
             return
 
-        return [col for col in [col.strip().upper() for col in columns]
-                if col in 'TPXYZABCUVWDIJQR' and not col == '']
+        if not isinstance(columns, str):
+            columns = tuple(columns)
+
+        return list(_validateColumns(columns))
 
     def newTool(self, tnum=None):
         """Get a dict of default tool values for a new tool."""
@@ -252,35 +287,34 @@ class DBToolTable(DataPlugin):
         self.loadToolTable()
         
     def loadToolTable(self): 
-        print("Loads ToolTable")
-        
-        tool_list = self.session.query(Tool).all()
+        LOG.debug("Loading tool table from DB")
         
-        for tool in tool_list:
-                   
-            self.table[tool.tool_no] = {'A': tool.a_offset,
-                                        'B': tool.b_offset,
-                                        'C': tool.b_offset,
-                                        'D': tool.diameter,
-                                        'I': 0.0,
-                                        'J': 0.0,
-                                        'P': tool.pocket,
-                                        'Q': 1,
-                                        'R': tool.remark,
-                                        'T': tool.tool_no,
-                                        'U': tool.u_offset,
-                                        'V': tool.v_offset,
-                                        'W': tool.w_offset,
-                                        'X': tool.x_offset,
-                                        'Y': tool.y_offset,
-                                        'Z': tool.z_offset}
+        # only load the columns we need as plain rows, this skips building
+        # and tracking a full ORM instance for every tool
+        tool_rows = self.session.query(Tool.tool_no,
+                                       Tool.pocket,
+                                       Tool.remark,
+                                       Tool.diameter,
+                                       Tool.x_offset,
+                                       Tool.y_offset,
+                                       Tool.z_offset,
+                                       Tool.a_offset,
+                                       Tool.b_offset,
+                                       Tool.c_offset,
+                                       Tool.u_offset,
+                                       Tool.v_offset,
+                                       Tool.w_offset).yield_per(500)
+
+        for tool in tool_rows:
+            self.table[tool.tool_no] = toolRowToDict(tool)
 
         # CMD.load_tool_table()
         
         self.tool_table_changed.emit(self.table.copy())     
 
     def getToolTable(self):
-        return self.table.copy()
+        """Get a read-only view of the current tool table."""
+        return MappingProxyType(self.table)
     
     def saveToolTable(self, tool_table, columns=None):
         """Write tooltable data to db.
@@ -295,101 +329,32 @@ class DBToolTable(DataPlugin):
         """
         
         self.table = tool_table
-        
-        tool_data = self.session.query(Tool)
-        
-        new_tool_dict = dict()
-        
-        for tool in tool_data:
-            tool_dict = dict()
-            
-            tool_dict['R'] = tool.remark
-            tool_dict['T'] = tool.tool_no
-            tool_dict['P'] = tool.pocket
-            tool_dict['X'] = tool.x_offset
-            tool_dict['Y'] = tool.y_offset
-            tool_dict['Z'] = tool.z_offset
-            tool_dict['A'] = tool.a_offset
-            tool_dict['B'] = tool.b_offset
-            tool_dict['C'] = tool.c_offset
-            tool_dict['U'] = tool.u_offset
-            tool_dict['V'] = tool.v_offset
-            tool_dict['W'] = tool.w_offset
-            tool_dict['Q'] = 1
-            tool_dict['I'] = 0.0
-            tool_dict['J'] = 0.0
-            tool_dict['D'] = tool.diameter
-            
-            new_tool_dict[tool.tool_no] = tool_dict
-
-        diff = DeepDiff(new_tool_dict, self.table, view="tree")
-                #
-        to_insert = diff.get("dictionary_item_added")
-        to_update = diff.get("values_changed")
-        to_delete = diff.get("dictionary_item_removed")
-        
-        if to_insert is not None:
-            print("TO INSTER")
-            for a in to_insert:
-                temp_tool = a.t2
-                
-                self.session.add(
-                    Tool(remark=temp_tool['R'],
-                         tool_no=temp_tool['T'],
-                         in_use=False,
-                         pocket=temp_tool['P'],
-                         x_offset=temp_tool['X'],
-                         y_offset=temp_tool['Y'],
-                         z_offset=temp_tool['Z'],
-                         a_offset=temp_tool['A'],
-                         b_offset=temp_tool['B'],
-                         c_offset=temp_tool['C'],
-                         i_offset=temp_tool['I'],
-                         j_offset=temp_tool['J'],
-                         q_offset=temp_tool['Q'],
-                         u_offset=temp_tool['U'],
-                         v_offset=temp_tool['V'],
-                         w_offset=temp_tool['W'],
-                         diameter=temp_tool['D'],
-                         tool_table_id=1
-                    )
-                )
-                self.session.commit()
-                
-        if to_update is not None:
-            print("TO UPDATE")
-            for a in to_update:
-                temp_tool = a.up.t2
-                
-                tool_data = self.session.query(Tool).filter(Tool.tool_no == temp_tool['T']).one()
-                
-                tool_data.remark = temp_tool['R']
-                tool_data.tool_no = temp_tool['T']
-                tool_data.in_use = False
-                tool_data.pocket = temp_tool['P']
-                tool_data.x_offset = temp_tool['X']
-                tool_data.y_offset = temp_tool['Y']
-                tool_data.z_offset = temp_tool['Z']
-                tool_data.a_offset = temp_tool['A']
-                tool_data.b_offset = temp_tool['B']
-                tool_data.c_offset = temp_tool['C']
-                tool_data.i_offset = temp_tool['I']
-                tool_data.j_offset = temp_tool['J']
-                tool_data.q_offset = temp_tool['Q']
-                tool_data.u_offset = temp_tool['U']
-                tool_data.v_offset = temp_tool['V']
-                tool_data.w_offset = temp_tool['W']
-                tool_data.diameter = temp_tool['D']
-                tool_data.tool_table_id = 1
-                
-                self.session.commit()
-
-        if to_delete is not None:
-            print("TO DELETE")
-            for a in to_delete:
-                temp_tool = a.t1
-                tool_row = tool_data.filter(Tool.tool_no == temp_tool['T']).one()
-                self.session.delete(tool_row)
-                self.session.commit()
-        
+
+        db_tools = {tool.tool_no: tool for tool in self.session.query(Tool)}
+
+        old_tool_nums = set(db_tools)
+        new_tool_nums = set(self.table)
+
+        to_insert = new_tool_nums - old_tool_nums
+        to_delete = old_tool_nums - new_tool_nums
+        to_update = [tnum for tnum in old_tool_nums & new_tool_nums
+                     if toolRowToDict(db_tools[tnum]) != self.table[tnum]]
+
+        if to_insert:
+            self.session.bulk_save_objects(
+                [Tool(**toolDictToRow(self.table[tnum])) for tnum in to_insert])
+
+        if to_update:
+            self.session.bulk_update_mappings(
+                Tool, [merge(toolDictToRow(self.table[tnum]), {'id': db_tools[tnum].id})
+                       for tnum in to_update])
+
+        # delete through the ORM so the Tool.model relationship is handled
+        # and orphaned ToolModel rows don't get picked up by a new tool
+        for tnum in to_delete:
+            self.session.delete(db_tools[tnum])
+
+        # commit all the changes in a single transaction
+        self.session.commit()
+
         CMD.load_tool_table()
@@ -24,8 +24,12 @@ Tool Table YAML configuration:
 import os
 import re
 import io
-from itertools import takewhile
+import time
+from itertools import takewhile, islice
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime
+from types import MappingProxyType
 
 import linuxcnc
 
@@ -45,6 +49,9 @@ INFO = Info()
 
 IN_DESIGNER = os.getenv('DESIGNER', False)
 
+# matches a single tool table word, e.g. `T1`, `Z +1.250000` or `D0.5`
+ITEM_REGEX = re.compile(r"([A-Z])\s*([0-9.+-]+)")
+
 
 def merge(a, b):
     """Shallow merge two dictionaries"""
@@ -104,12 +111,28 @@ COLUMN_LABELS = {
     'Z': 'Z Offset',
 }
 
+ALL_COLUMNS = frozenset('TPXYZABCUVWDIJQR')
+
+# value types of the numeric columns when reading tool table
+COLUMN_TYPES = {col: int if col in 'TPQ' else float for col in 'TPXYZABCUVWDIJQ'}
+
+# Delays (in ms) before re-loading the tool table after the file changes
+RELOAD_DELAY = 50
+RELOAD_MAX_DELAY = 250
+
 # Column formats when writing tool table
 INT_COLUMN_WIDTH = 6
 FLOAT_COLUMN_WIDTH = 12
 FLOAT_DECIMAL_PLACES = 6
 
 
+@lru_cache(maxsize=32)
+def _validateColumns(columns):
+    # columns must be hashable (str or tuple) so the result can be cached
+    return tuple(col for col in (col.strip().upper() for col in columns)
+                 if col in ALL_COLUMNS)
+
+
 def makeLorumIpsumToolTable():
     return {i: merge(DEFAULT_TOOL,
                      {'T': i, 'P': i, 'R': 'Lorum Ipsum ' + str(i)})
@@ -131,6 +154,9 @@ class ToolTable(DataPlugin):
         self.db_prog = INFO.ini.find('EMCIO','DB_PROGRAM')
         self.fs_watcher = None
         self.orig_header_lines = []
+        self._file_data = None
+        self._file_table = {}
+        self._sorted_tool_nums = sorted(self.TOOL_TABLE)
         self.file_header_template = file_header_template or ''
         self.remember_tool_in_spindle = remember_tool_in_spindle
         self.columns = self.validateColumns(columns) or [c for c in 'TPXYZABCUVWDIJQR']
@@ -194,12 +220,18 @@ class ToolTable(DataPlugin):
         :param item: the name of the tool data item to get
         :return: dict, int, float, str
         """
+        # the channel value is updated on tool change and tool table reload
         if item is None:
-            return self.TOOL_TABLE[STAT.tool_in_spindle]
-        return self.TOOL_TABLE[STAT.tool_in_spindle].get(item[0].upper())
+            return chan.value
+        return chan.value.get(item[0].upper())
 
     def initialise(self):
         if self.db_prog is None:
+            self.reload_timer = QTimer()
+            self.reload_timer.setSingleShot(True)
+            self.reload_timer.timeout.connect(self.reloadToolTable)
+            self.reload_deadline = 0
+
             self.fs_watcher = QFileSystemWatcher()
             self.fs_watcher.addPath(self.tool_table_file)
             self.fs_watcher.fileChanged.connect(self.onToolTableFileChanged)
@@ -226,8 +258,10 @@ class ToolTable(DataPlugin):
         if not isinstance(columns, (str, list, tuple)):
             return
 
-        return [col for col in [col.strip().upper() for col in columns]
-                if col in 'TPXYZABCUVWDIJQR' and not col == '']
+        if not isinstance(columns, str):
+            columns = tuple(columns)
+
+        return list(_validateColumns(columns))
 
     def newTool(self, tnum=None):
         """Get a dict of default tool values for a new tool."""
@@ -240,8 +274,15 @@ class ToolTable(DataPlugin):
     def onToolTableFileChanged(self, path):
         LOG.debug('Tool Table file changed: {}'.format(path))
         # ToolEdit deletes the file and then rewrites it, so wait
-        # a bit to ensure the new data has been writen out.
-        QTimer.singleShot(50, self.reloadToolTable)
+        # a bit to ensure the new data has been writen out. Restarting
+        # the timer coalesces bursts of changes into a single reload,
+        # but a steady stream of changes can't postpone it indefinitely.
+        now = time.monotonic()
+        if not self.reload_timer.isActive():
+            self.reload_deadline = now + RELOAD_MAX_DELAY / 1000.0
+
+        remaining = int((self.reload_deadline - now) * 1000)
+        self.reload_timer.start(max(0, min(RELOAD_DELAY, remaining)))
 
     def setCurrentToolNumber(self, tool_num):
         self.current_tool.setValue(self.TOOL_TABLE[tool_num])
@@ -251,16 +292,83 @@ class ToolTable(DataPlugin):
         if self.tool_table_file not in self.fs_watcher.files() and self.db_prog is None:
             self.fs_watcher.addPath(self.tool_table_file)
 
-        # reload with the new data
-        tool_table = self.loadToolTable()
-        self.tool_table_changed.emit(tool_table)
+        # reload with the new data, emits tool_table_changed
+        self.loadToolTable()
 
     def iterTools(self, tool_table=None, columns=None):
-        tool_table = tool_table or self.TOOL_TABLE
+        if tool_table:
+            tool_nums = sorted(tool_table)
+        else:
+            tool_table = self.TOOL_TABLE
+            tool_nums = self._sorted_tool_nums
+
         columns = self.validateColumns(columns) or self.columns
-        for tool in sorted(tool_table.keys()):
-            tool_data = tool_table[tool]
-            yield [tool_data[key] for key in columns]
+        get_values = itemgetter(*columns)
+
+        # itemgetter returns a bare value instead of a tuple for one column
+        if len(columns) == 1:
+            for tool in tool_nums:
+                yield [get_values(tool_table[tool])]
+        else:
+            for tool in tool_nums:
+                yield list(get_values(tool_table[tool]))
+
+    def parseToolTableData(self, data):
+        """Parse the contents of a LinuxCNC tool table file.
+
+        Args:
+            data (str) : The text of the tool table file.
+
+        Returns:
+            A dict of tool data dicts keyed by tool number.
+        """
+        lines = []
+        header_end = 0
+        for line in data.splitlines():
+            line = line.strip()
+            lines.append(line)
+            # the last line starting with a semicolon is the table header
+            if line.startswith(';'):
+                header_end = len(lines)
+
+        # get header data so it can be restored
+        if header_end:
+            self.orig_header_lines = list(takewhile(lambda l:
+                                    not l.strip() == '---' and
+                                    not l.startswith(';Tool'), islice(lines, header_end)))
+
+        table = {0: NO_TOOL,}
+        for line in islice(lines, header_end, None):
+
+            data, sep, comment = line.partition(';')
+            items = ITEM_REGEX.findall(data)
+            if not items:
+                # blank or comment only line
+                continue
+
+            tool = DEFAULT_TOOL.copy()
+            for descriptor, value in items:
+                value_type = COLUMN_TYPES.get(descriptor)
+                if value_type is None:
+                    continue
+
+                try:
+                    tool[descriptor] = value_type(value)
+                except ValueError:
+                    LOG.error('Error converting value to {}: {}'
+                              .format(value_type.__name__, value))
+                    break
+
+            tool['R'] = comment.strip()
+
+            tnum = tool['T']
+            if tnum == -1:
+                continue
+
+            # add the tool to the table
+            table[tnum] = tool
+
+        return table
 
     def loadToolTable(self, tool_file=None):
 
@@ -270,88 +378,50 @@ class ToolTable(DataPlugin):
         if not os.path.exists(tool_file) and self.db_prog is None:
             if IN_DESIGNER:
                 lorum_tooltable = makeLorumIpsumToolTable()
-                self.current_tool.setValue(lorum_tooltable)
+                self.current_tool.setValue(lorum_tooltable[0])
                 return lorum_tooltable
             LOG.critical("Tool table file does not exist: {}".format(tool_file))
             return {}
 
         if self.db_prog is None:
             with io.open(tool_file, 'r') as fh:
-                lines = [line.strip() for line in fh.readlines()]
-
-            # find opening colon, and get header data so it can be restored
-            for rlnum, line in enumerate(reversed(lines)):
-                if line.startswith(';'):
-                    lnum = len(lines) - rlnum
-                    raw_header = lines[:lnum]
-                    lines = lines[lnum:]
-    
-                    self.orig_header_lines = list(takewhile(lambda l:
-                                            not l.strip() == '---' and
-                                            not l.startswith(';Tool'), raw_header))
-                    break
+                data = fh.read()
 
-            table = {0: NO_TOOL,}
-            for line in lines:
-    
-                data, sep, comment = line.partition(';')
-                items = re.findall(r"([A-Z]+[0-9.+-]+)", data.replace(' ', ''))
-    
-                tool = DEFAULT_TOOL.copy()
-                for item in items:
-                    descriptor = item[0]
-                    if descriptor in 'TPXYZABCUVWDIJQR':
-                        value = item[1:]
-                        if descriptor in ('T', 'P', 'Q'):
-    
-                            try:
-                                tool[descriptor] = int(value)
-                            except:
-                                LOG.error('Error converting value to int: {}'.format(value))
-                                break
-                        else:
-                            try:
-                                tool[descriptor] = float(value)
-                            except:
-                                LOG.error('Error converting value to float: {}'.format(value))
-                                break
-    
-                tool['R'] = comment.strip()
-    
-                tnum = tool['T']
-                if tnum == -1:
-                    continue
-    
-                # add the tool to the table
-                table[tnum] = tool
+            # only re-parse the file if its contents have actually changed,
+            # LinuxCNC and ToolEdit often trigger several reloads for one save
+            if data != self._file_data:
+                self._file_table = self.parseToolTableData(data)
+                self._file_data = data
+
+            # copy the tool dicts so edits to the table don't alter the cache
+            table = {tnum: tool.copy() for tnum, tool in self._file_table.items()}
         else:
             # build tool table from linxcnc status object
             table = {0: NO_TOOL,}
-            lcnc_tools = STAT.tool_table
-            for tool in lcnc_tools:
-                if int(tool.id) != -1:
-                    newtool = DEFAULT_TOOL.copy()
-                    # build up new tool
-                    newtool['T'] = int(tool.id)
-                    newtool['P'] = int(lcnc_tools.index(tool))
-                    newtool['X'] = float(tool.xoffset)
-                    newtool['Y'] = float(tool.yoffset)
-                    newtool['Z'] = float(tool.zoffset)
-                    newtool['A'] = float(tool.aoffset)
-                    newtool['B'] = float(tool.boffset)
-                    newtool['C'] = float(tool.coffset)
-                    newtool['U'] = float(tool.uoffset)
-                    newtool['V'] = float(tool.voffset)
-                    newtool['W'] = float(tool.woffset)
-                    newtool['D'] = float(tool.diameter)
-                    newtool['I'] = float(tool.frontangle)
-                    newtool['J'] = float(tool.backangle)
-                    newtool['Q'] = int(tool.orientation)
-                    newtool['R'] = 'Database tool'
-                    table[int(tool.id)] = newtool
+            for pocket, tool in enumerate(STAT.tool_table):
+                tnum = int(tool.id)
+                if tnum != -1:
+                    # every field is set, so no need to copy DEFAULT_TOOL
+                    table[tnum] = {'T': tnum,
+                                   'P': pocket,
+                                   'X': float(tool.xoffset),
+                                   'Y': float(tool.yoffset),
+                                   'Z': float(tool.zoffset),
+                                   'A': float(tool.aoffset),
+                                   'B': float(tool.boffset),
+                                   'C': float(tool.coffset),
+                                   'U': float(tool.uoffset),
+                                   'V': float(tool.voffset),
+                                   'W': float(tool.woffset),
+                                   'D': float(tool.diameter),
+                                   'I': float(tool.frontangle),
+                                   'J': float(tool.backangle),
+                                   'Q': int(tool.orientation),
+                                   'R': 'Database tool'}
 
         # update tooltablec
         self.__class__.TOOL_TABLE = table
+        self._sorted_tool_nums = sorted(table)
 
         self.current_tool.setValue(self.TOOL_TABLE[STATUS.tool_in_spindle.getValue()])
 
@@ -359,10 +429,11 @@ class ToolTable(DataPlugin):
         # print(json.dumps(table, sort_keys=True, indent=4))
 
         self.tool_table_changed.emit(table)
-        return table.copy()
+        return MappingProxyType(table)
 
     def getToolTable(self):
-        return self.TOOL_TABLE.copy()
+        """Get a read-only view of the current tool table."""
+        return MappingProxyType(self.TOOL_TABLE)
 
     def saveToolTable(self, tool_table, columns=None, tool_file=None):
         """Write tooltable data to file.
@@ -385,7 +456,7 @@ class ToolTable(DataPlugin):
         if tool_file is None:
             tool_file = self.tool_table_file
 
-        lines = []
+        buf = io.StringIO()
         header_lines = []
 
         # restore file header
@@ -405,56 +476,48 @@ class ToolTable(DataPlugin):
             except ValueError:
                 header_lines = self.orig_header_lines
 
-        lines.extend(header_lines)
+        for line in header_lines:
+            buf.write(line + '\n')
 
         # create the table header
         items = []
         if 'P' not in columns:
             columns.insert(1, 'P')
-        
+
+        # build the row format once, e.g. 'T{T:<6}P{P:<6}Z{Z:<+12.6f}'
+        cell_formats = []
         for col in columns:
             if col == 'R':
                 continue
-            w = (INT_COLUMN_WIDTH if col in 'TPQ' else FLOAT_COLUMN_WIDTH) - \
-                (1 if col == self.columns[0] else 0)
+            if col in 'TPQ':
+                w = INT_COLUMN_WIDTH
+                cell_formats.append('%s{%s:<%d}' % (col, col, w))
+            else:
+                w = FLOAT_COLUMN_WIDTH
+                cell_formats.append('%s{%s:<+%d.%df}' % (col, col, w, FLOAT_DECIMAL_PLACES))
+
+            w -= (1 if col == self.columns[0] else 0)
             items.append('{:<{w}}'.format(COLUMN_LABELS[col], w=w))
 
+        row_format = ''.join(cell_formats)
+
         items.append('Remark')
-        lines.append(';' + ' '.join(items))
+        buf.write(';' + ' '.join(items) + '\n')
 
         # add the tools
-        for tool_num in sorted(tool_table.keys())[1:]:
-            items = []
+        for tool_num in sorted(tool_table)[1:]:
             tool_data = tool_table[tool_num]
-            for col in columns:
-                if col == 'R':
-                    continue
-                if col in 'TPQ':
-                    items.append('{col}{val:<{w}}'
-                                 .format(col=col,
-                                         val=tool_data[col],
-                                         w=INT_COLUMN_WIDTH))
-                else:
-                    items.append('{col}{val:<+{w}.{d}f}'
-                                 .format(col=col,
-                                         val=tool_data[col],
-                                         w=FLOAT_COLUMN_WIDTH,
-                                         d=FLOAT_DECIMAL_PLACES))
+            buf.write(row_format.format_map(tool_data))
 
             comment = tool_data.get('R', '')
             if comment != '':
-                items.append('; ' + comment)
-
-
-            lines.append(''.join(items))
+                buf.write('; ' + comment)
 
-        # for line in lines:
-        #     print(line)
+            buf.write('\n')
 
         # write to file
         with io.open(tool_file, 'w') as fh:
-            fh.write('\n'.join(lines))
-            fh.write('\n')  # new line at end of file
+            fh.write(buf.getvalue())
             fh.flush()
             os.fsync(fh.fileno())
 
@@ -9,6 +9,9 @@ from qtpyvcp.utilities.logger import getLogger
 
 LOG = getLogger(__name__)
 
+# matches a single tool table word, e.g. `T1`, `Z +1.250000` or `D0.5`
+ITEM_REGEX = re.compile(r"([A-Z])\s*([0-9.+-]+)")
+
 def main():
 
     with open("tool.tbl", 'r') as tt_file:
@@ -17,7 +20,7 @@ def main():
     tools_data = list()
     for index, tt_tool in enumerate(tt_tools):
         data, sep, comment = tt_tool.partition(';')
-        items = re.findall(r"([A-Z]+[0-9.+-]+)", data.replace(' ', ''))
+        items = ITEM_REGEX.findall(data)
 
         tool_data = dict()
 
@@ -38,10 +41,8 @@ def main():
         tool_data['D'] = 0.0
 
         if len(items):
-            for item in items:
-                descriptor = item[0]
+            for descriptor, value in items:
                 if descriptor in 'TPXYZABCUVWDIJQR':
-                    value = item[1:]
                     if descriptor in ('T', 'P', 'Q'):
                         try:
                             tool_data[descriptor] = int(value)
@@ -16,12 +16,11 @@
 #   You should have received a copy of the GNU General Public License
 #   along with QtPyVCP.  If not, see <http://www.gnu.org/licenses/>.
 
-import subprocess
-
 from qtpy.QtCore import QTimer
 from qtpy.QtWidgets import QPushButton, QVBoxLayout, QCheckBox
 
 from qtpyvcp.widgets.dialogs.base_dialog import BaseDialog
+from qtpyvcp.widgets.input_widgets.probesim_widget import set_probe_input
 
 
 from qtpyvcp.utilities.info import Info
@@ -60,20 +59,20 @@ class ProbeSim(BaseDialog):
 
         if self.pulse_checkbox.checkState():
             self.timer.start(1000)
-            subprocess.Popen(['halcmd', 'setp', 'motion.probe-input', '1'])
+            set_probe_input(1)
             
         else:
-            subprocess.Popen(['halcmd', 'setp', 'motion.probe-input', '1'])
+            set_probe_input(1)
 
     def touch_off(self):
 
         if self.pulse_checkbox.checkState():
             return
 
-        subprocess.Popen(['halcmd', 'setp', 'motion.probe-input', '0'])
+        set_probe_input(0)
 
     def pulse_off(self):
-        subprocess.Popen(['halcmd', 'setp', 'motion.probe-input', '0'])
+        set_probe_input(0)
 
     def close(self):
         self.hide()
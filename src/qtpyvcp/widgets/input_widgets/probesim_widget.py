@@ -18,6 +18,11 @@
 
 import subprocess
 
+try:
+    import hal
+except ImportError:
+    hal = None
+
 from qtpy.QtCore import QTimer
 from qtpy.QtWidgets import QPushButton, QHBoxLayout, QPushButton, QWidget
 
@@ -27,6 +32,18 @@ from qtpyvcp.utilities import logger
 Log = logger.getLogger(__name__)
 
 
+def set_probe_input(value):
+    """Set the motion.probe-input pin, without spawning halcmd if possible."""
+    if hal is not None:
+        try:
+            hal.set_p('motion.probe-input', str(value))
+            return
+        except RuntimeError as e:
+            Log.debug("Failed to set probe input via HAL lib: %s", e)
+
+    subprocess.Popen(['halcmd', 'setp', 'motion.probe-input', str(value)])
+
+
 class ProbeSim(QWidget):
 
     def __init__(self, parent=None):
@@ -62,17 +79,17 @@ class ProbeSim(QWidget):
 
         if self.pulse_button.isChecked():
             self.timer.start(1000)
-            subprocess.Popen(['halcmd', 'setp', 'motion.probe-input', '1'])
+            set_probe_input(1)
             
         else:
-            subprocess.Popen(['halcmd', 'setp', 'motion.probe-input', '1'])
+            set_probe_input(1)
 
     def touch_off(self):
 
         if self.pulse_button.isChecked():
             return
 
-        subprocess.Popen(['halcmd', 'setp', 'motion.probe-input', '0'])
+        set_probe_input(0)
 
     def pulse_off(self):
-        subprocess.Popen(['halcmd', 'setp', 'motion.probe-input', '0'])
+        set_probe_input(0)
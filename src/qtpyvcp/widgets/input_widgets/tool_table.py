@@ -102,7 +102,9 @@ class ToolModel(QStandardItemModel):
         self._columns = self.tt.columns
         self._column_labels = self.tt.COLUMN_LABELS
 
-        self._tool_table = self.tt.getToolTable()
+        # the model edits the tools in place, so work on our own copies
+        self._tool_table = {tnum: dict(tool) for tnum, tool
+                            in self.tt.getToolTable().items()}
 
         self.setColumnCount(self.columnCount())
         self.setRowCount(1000)  # (self.rowCount())
@@ -124,7 +126,7 @@ class ToolModel(QStandardItemModel):
     def updateModel(self, tool_table):
         # update model with new data
         self.beginResetModel()
-        self._tool_table = tool_table
+        self._tool_table = {tnum: dict(tool) for tnum, tool in tool_table.items()}
         self.endResetModel()
 
     def setColumns(self, columns):
@@ -6,7 +6,6 @@ from qtpy.QtWidgets import QDialog, QDialogButtonBox, QApplication
 
 from qtpy.QtDesigner import QDesignerFormWindowInterface
 
-
 from qtpyvcp.widgets.qtdesigner import _PluginExtension
 
 UI_FILE = os.path.join(os.path.dirname(__file__), "dro_editor.ui")
@@ -25,24 +24,32 @@ class DroEditorExtension(_PluginExtension):
 class DroEditor(QDialog):
     """QDialog for user-friendly editing of DRO properties in Qt Designer."""
 
+    # form class compiled from UI_FILE, shared by all instances
+    _ui_form_class = None
+
     def __init__(self, widget, parent=None):
         super(DroEditor, self).__init__(parent)
 
         self.widget = widget
         self.app = QApplication.instance()
 
-        uic.loadUi(UI_FILE, self)
+        # only parse and compile the .ui file the first time the editor is opened
+        if DroEditor._ui_form_class is None:
+            DroEditor._ui_form_class, _ = uic.loadUiType(UI_FILE)
+
+        self.ui = DroEditor._ui_form_class()
+        self.ui.setupUi(self)
 
-        self.axisCombo.setCurrentIndex(self.widget.axisNumber)
-        self.refTypCombo.setCurrentIndex(self.widget.referenceType)
+        self.ui.axisCombo.setCurrentIndex(self.widget.axisNumber)
+        self.ui.refTypCombo.setCurrentIndex(self.widget.referenceType)
 
-        self.inFmtEntry.setText(self.widget.inchFormat)
-        self.mmFmtEntry.setText(self.widget.millimeterFormat)
-        self.degFmtEntry.setText(self.widget.degreeFormat)
+        self.ui.inFmtEntry.setText(self.widget.inchFormat)
+        self.ui.mmFmtEntry.setText(self.widget.millimeterFormat)
+        self.ui.degFmtEntry.setText(self.widget.degreeFormat)
 
-        self.latheModeCombo.setCurrentIndex(self.widget.latheMode)
+        self.ui.latheModeCombo.setCurrentIndex(self.widget.latheMode)
 
-        bb = self.buttonBox
+        bb = self.ui.buttonBox
         bb.button(QDialogButtonBox.Apply).setDefault(True)
         bb.button(QDialogButtonBox.Cancel).setDefault(False)
         bb.button(QDialogButtonBox.Apply).clicked.connect(self.accept)
@@ -50,21 +57,21 @@ class DroEditor(QDialog):
     @Slot()
     def accept(self):
         """Commit changes"""
-        # general options
-        self.setCursorProperty('axisNumber', self.axisCombo.currentIndex())
-        self.setCursorProperty('referenceType', self.refTypCombo.currentIndex())
+        # look up the form window once and set all the properties on it
+        form = QDesignerFormWindowInterface.findFormWindow(self.widget)
+        if form:
+            cursor = form.cursor()
 
-        # format options
-        self.setCursorProperty('inchFormat', self.inFmtEntry.text())
-        self.setCursorProperty('millimeterFormat', self.mmFmtEntry.text())
-        self.setCursorProperty('degreeFormat', self.degFmtEntry.text())
+            # general options
+            cursor.setProperty('axisNumber', self.ui.axisCombo.currentIndex())
+            cursor.setProperty('referenceType', self.ui.refTypCombo.currentIndex())
 
-        # lathe options
-        self.setCursorProperty('latheMode', self.latheModeCombo.currentIndex())
+            # format options
+            cursor.setProperty('inchFormat', self.ui.inFmtEntry.text())
+            cursor.setProperty('millimeterFormat', self.ui.mmFmtEntry.text())
+            cursor.setProperty('degreeFormat', self.ui.degFmtEntry.text())
 
-        self.close()
+            # lathe options
+            cursor.setProperty('latheMode', self.ui.latheModeCombo.currentIndex())
 
-    def setCursorProperty(self, prop_name, value):
-        form = QDesignerFormWindowInterface.findFormWindow(self.widget)
-        if form:
-            form.cursor().setProperty(prop_name, value)
+        self.close()